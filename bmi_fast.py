@@ -0,0 +1,67 @@
+"""
+WikiFit - Batched BMI computation
+
+Vectorized BMI kernel for bulk workloads (e.g. a future CSV import path).
+When Numba is installed the loop JIT-compiles and parallelizes across
+cores; without it the same code runs as plain Python over numpy arrays,
+so the module works either way.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        # No-op decorator so the kernel below runs as plain Python
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Unit codes accepted by calculate_bmi_batch
+UNIT_M = 0
+UNIT_CM = 1
+UNIT_FT = 2
+
+# Category codes match wikifit_basic._BMI_LABELS ordering:
+# 0 Underweight, 1 Normal weight, 2 Overweight, 3 Obese
+CATEGORY_LABELS = ("Underweight", "Normal weight", "Overweight", "Obese")
+
+
+@njit(cache=True, parallel=True)
+def calculate_bmi_batch(weights, heights, unit_code):
+    """Compute BMI values and category codes for arrays of measurements.
+
+    Args:
+        weights: float64 array of weights in kg
+        heights: float64 array of heights in the unit given by unit_code
+        unit_code: UNIT_M, UNIT_CM or UNIT_FT (ft uses the app's ft.in
+            convention, e.g. 5.6 for 5'6")
+
+    Returns:
+        tuple: (float64 array of BMI values, int8 array of category codes)
+    """
+    out_bmi = np.empty(weights.size, dtype=np.float64)
+    out_cat = np.empty(weights.size, dtype=np.int8)
+    for i in prange(weights.size):
+        h = heights[i]
+        if unit_code == 1:  # cm
+            h = h / 100.0
+        elif unit_code == 2:  # ft.in
+            feet_whole = int(h)
+            h = feet_whole * 0.3048 + (h - feet_whole) * 10 * 0.0254
+        b = weights[i] / (h * h)
+        out_bmi[i] = b
+        if b >= 30.0:
+            out_cat[i] = 3
+        elif b >= 25.0:
+            out_cat[i] = 2
+        elif b >= 18.5:
+            out_cat[i] = 1
+        else:
+            out_cat[i] = 0
+    return out_bmi, out_cat
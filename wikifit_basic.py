@@ -1,8 +1,16 @@
+import bisect
 import streamlit as st
 import random
 from datetime import datetime
 import wikimedia  # Import our Wikimedia module
 
+# One clock read per rerun keeps the greeting, sidebar date, tip season and
+# footer year consistent even across a midnight boundary
+NOW = datetime.now()
+
+# Dedicated generator for tip/fact picks; seedable for reproducible tests
+_RNG = random.Random()
+
 # Setup page config
 st.set_page_config(page_title="WikiFit Basic", page_icon="💪")
 st.title("💪 WikiFit Basic – Health & Fitness App")
@@ -11,6 +19,7 @@ st.title("💪 WikiFit Basic – Health & Fitness App")
 # Utility Functions
 # -------------------------------
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_wikipedia_summary(term):
     """Get summary from Wikipedia API with error handling"""
     try:
@@ -19,123 +28,131 @@ def get_wikipedia_summary(term):
         st.error(f"Request error: {str(e)}")
         return "Connection error. Please try again later."
 
-def get_random_health_tip():
+# Base tips that apply all year
+BASE_TIPS = [
+    "Drink at least 2 liters of water every day.",
+    "Do at least 30 minutes of physical activity daily.",
+    "Maintain a regular sleep schedule.",
+    "Include fruits and vegetables in every meal.",
+    "Take short breaks during long sitting hours.",
+    "Practice mindfulness meditation for 10 minutes daily.",
+    "Reduce sodium intake to help control blood pressure.",
+    "Limit screen time before bedtime for better sleep.",
+    "Choose whole grains over refined carbohydrates.",
+    "Incorporate strength training at least twice a week."
+]
+
+# Seasonal tips
+SEASONAL_TIPS = {
+    # Winter (Dec-Feb)
+    "winter": [
+        "Increase vitamin D intake during winter months.",
+        "Stay hydrated even when it's cold.",
+        "Wash hands frequently to prevent seasonal colds and flu."
+    ],
+    # Spring (Mar-May)
+    "spring": [
+        "Consider seasonal allergy preparations before symptoms start.",
+        "Spring clean your diet - add fresh seasonal produce.",
+        "Gradually increase outdoor exercise as weather improves."
+    ],
+    # Summer (Jun-Aug)
+    "summer": [
+        "Apply sunscreen 30 minutes before sun exposure.",
+        "Stay extra hydrated during hot days.",
+        "Exercise during cooler parts of the day to avoid heat exhaustion."
+    ],
+    # Fall (Sep-Nov)
+    "fall": [
+        "Boost immune system as cold and flu season approaches.",
+        "Adjust exercise routines for cooling temperatures.",
+        "Incorporate seasonal produce like pumpkins and apples."
+    ]
+}
+
+# Precomputed per-season pools so the hot path never concatenates lists
+TIPS_BY_SEASON = {season: tuple(BASE_TIPS + tips) for season, tips in SEASONAL_TIPS.items()}
+
+# Month number (1-12) -> season; index 0 unused
+MONTH_TO_SEASON = (None, "winter", "winter", "spring", "spring", "spring",
+                   "summer", "summer", "summer", "fall", "fall", "fall", "winter")
+
+# Hour of day (0-23) -> greeting, same banding as the old if/elif chain
+_GREETING_BY_HOUR = tuple(["Good evening"] * 5 + ["Good morning"] * 7 +
+                          ["Good afternoon"] * 5 + ["Good evening"] * 7)
+
+
+def get_random_health_tip(month=None):
     """Return a random health tip with seasonal awareness"""
-    # Get current month to provide seasonal tips
-    current_month = datetime.now().month
-    
-    # Base tips that apply all year
-    base_tips = [
-        "Drink at least 2 liters of water every day.",
-        "Do at least 30 minutes of physical activity daily.",
-        "Maintain a regular sleep schedule.",
-        "Include fruits and vegetables in every meal.",
-        "Take short breaks during long sitting hours.",
-        "Practice mindfulness meditation for 10 minutes daily.",
-        "Reduce sodium intake to help control blood pressure.",
-        "Limit screen time before bedtime for better sleep.",
-        "Choose whole grains over refined carbohydrates.",
-        "Incorporate strength training at least twice a week."
+    season = MONTH_TO_SEASON[month if month is not None else NOW.month]
+    return _RNG.choice(TIPS_BY_SEASON[season])
+
+WORKOUTS = {
+    "full_body": [
+        "10 Jumping Jacks",
+        "10 Push-ups",
+        "15 Squats",
+        "20-second Plank",
+        "10 Lunges (each leg)",
+        "Repeat 3 times"
+    ],
+    "cardio": [
+        "30 seconds Jumping Jacks",
+        "30 seconds High Knees",
+        "30 seconds Butt Kicks",
+        "30 seconds Mountain Climbers",
+        "30 seconds rest",
+        "Repeat 4 times"
+    ],
+    "strength": [
+        "12 Push-ups",
+        "15 Squats with 5 second hold",
+        "10 Tricep Dips",
+        "10 Glute Bridges",
+        "8 Superman Holds",
+        "Repeat 3 times"
+    ],
+    "flexibility": [
+        "30 seconds Hamstring Stretch",
+        "30 seconds Quad Stretch (each leg)",
+        "30 seconds Child's Pose",
+        "30 seconds Cat-Cow Stretch",
+        "30 seconds Butterfly Stretch",
+        "Repeat 2 times"
     ]
-    
-    # Seasonal tips
-    seasonal_tips = {
-        # Winter (Dec-Feb)
-        "winter": [
-            "Increase vitamin D intake during winter months.",
-            "Stay hydrated even when it's cold.",
-            "Wash hands frequently to prevent seasonal colds and flu."
-        ],
-        # Spring (Mar-May)
-        "spring": [
-            "Consider seasonal allergy preparations before symptoms start.",
-            "Spring clean your diet - add fresh seasonal produce.",
-            "Gradually increase outdoor exercise as weather improves."
-        ],
-        # Summer (Jun-Aug)
-        "summer": [
-            "Apply sunscreen 30 minutes before sun exposure.",
-            "Stay extra hydrated during hot days.",
-            "Exercise during cooler parts of the day to avoid heat exhaustion."
-        ],
-        # Fall (Sep-Nov)
-        "fall": [
-            "Boost immune system as cold and flu season approaches.",
-            "Adjust exercise routines for cooling temperatures.",
-            "Incorporate seasonal produce like pumpkins and apples."
-        ]
-    }
-    
-    # Determine current season
-    if current_month in [12, 1, 2]:
-        season = "winter"
-    elif current_month in [3, 4, 5]:
-        season = "spring"
-    elif current_month in [6, 7, 8]:
-        season = "summer"
-    else:  # 9, 10, 11
-        season = "fall"
-    
-    # Combine base tips with seasonal tips
-    all_tips = base_tips + seasonal_tips[season]
-    return random.choice(all_tips)
+}
+
 
 def get_workout_plan(workout_type="full_body"):
     """Get workout plan based on workout type"""
-    workouts = {
-        "full_body": [
-            "10 Jumping Jacks",
-            "10 Push-ups",
-            "15 Squats",
-            "20-second Plank",
-            "10 Lunges (each leg)",
-            "Repeat 3 times"
-        ],
-        "cardio": [
-            "30 seconds Jumping Jacks",
-            "30 seconds High Knees",
-            "30 seconds Butt Kicks",
-            "30 seconds Mountain Climbers",
-            "30 seconds rest",
-            "Repeat 4 times"
-        ],
-        "strength": [
-            "12 Push-ups",
-            "15 Squats with 5 second hold",
-            "10 Tricep Dips",
-            "10 Glute Bridges",
-            "8 Superman Holds",
-            "Repeat 3 times"
-        ],
-        "flexibility": [
-            "30 seconds Hamstring Stretch",
-            "30 seconds Quad Stretch (each leg)",
-            "30 seconds Child's Pose",
-            "30 seconds Cat-Cow Stretch",
-            "30 seconds Butterfly Stretch",
-            "Repeat 2 times"
-        ]
-    }
-    return workouts.get(workout_type, workouts["full_body"])
+    return WORKOUTS.get(workout_type, WORKOUTS["full_body"])
+
+
+FACTS = (
+    "The human body has 206 bones.",
+    "Your heart beats about 100,000 times a day.",
+    "The skin is the body's largest organ.",
+    "The brain uses around 20% of the body's oxygen.",
+    "Laughter is good for your heart and can reduce stress.",
+    "Adults have fewer bones than babies. Babies are born with 300 bones, but some fuse together.",
+    "The strongest muscle in your body is your masseter (jaw muscle)."
+)
+
 
 def get_did_you_know_fact():
     """Return a random health fact"""
-    facts = [
-        "The human body has 206 bones.",
-        "Your heart beats about 100,000 times a day.",
-        "The skin is the body's largest organ.",
-        "The brain uses around 20% of the body's oxygen.",
-        "Laughter is good for your heart and can reduce stress.",
-        "Adults have fewer bones than babies. Babies are born with 300 bones, but some fuse together.",
-        "The strongest muscle in your body is your masseter (jaw muscle)."
-    ]
-    return random.choice(facts)
+    return _RNG.choice(FACTS)
+
+# BMI category cutoffs; bisect_right maps a BMI straight to its label index
+_BMI_CUTOFFS = (18.5, 25.0, 30.0)
+_BMI_LABELS = ("Underweight", "Normal weight", "Overweight", "Obese")
+
 
 def calculate_bmi(weight, height, unit="m"):
     """Calculate BMI based on weight and height"""
     if weight <= 0 or height <= 0:
         return None, None
-    
+
     # Convert height to meters for calculation
     if unit == "cm":
         height = height / 100.0
@@ -143,18 +160,9 @@ def calculate_bmi(weight, height, unit="m"):
         feet_whole = int(height)
         inches = (height - feet_whole) * 10
         height = feet_whole * 0.3048 + inches * 0.0254
-        
-    bmi = weight / (height ** 2)
-    
-    if bmi < 18.5:
-        category = "Underweight"
-    elif 18.5 <= bmi < 25:
-        category = "Normal weight"
-    elif 25 <= bmi < 30:
-        category = "Overweight"
-    else:
-        category = "Obese"
-        
+
+    bmi = weight / (height * height)
+    category = _BMI_LABELS[bisect.bisect_right(_BMI_CUTOFFS, bmi)]
     return round(bmi, 2), category
 
 # -------------------------------
@@ -168,20 +176,14 @@ if 'quiz_score' not in st.session_state:
     st.session_state.quiz_score = 0
 
 # Get time of day for personalized welcome
-current_hour = datetime.now().hour
-if 5 <= current_hour < 12:
-    greeting = "Good morning"
-elif 12 <= current_hour < 17:
-    greeting = "Good afternoon"
-else:
-    greeting = "Good evening"
+greeting = _GREETING_BY_HOUR[NOW.hour]
 
 # Welcome message in the sidebar
 st.sidebar.markdown(f"### {greeting}!")
 st.sidebar.markdown("Welcome to WikiFit, your personal health assistant.")
 
 # Display current date
-st.sidebar.markdown(f"**Today**: {datetime.now().strftime('%B %d, %Y')}")
+st.sidebar.markdown(f"**Today**: {NOW.strftime('%B %d, %Y')}")
 
 # Navigation sidebar
 menu = st.sidebar.selectbox("Navigate", [
@@ -199,7 +201,7 @@ st.sidebar.markdown("To access AI features and the Knowledge Center, [install th
 # Page content based on menu selection
 if menu == "Daily Tip":
     st.subheader("📆 Daily Fitness/Nutrition Tip")
-    st.success(get_random_health_tip())
+    st.success(get_random_health_tip(NOW.month))
 
 elif menu == "Health Search":
     st.subheader("🔍 Search Health Info from Wikipedia")
@@ -281,4 +283,4 @@ elif menu == "BMI Calculator":
 
 # Footer
 st.sidebar.markdown("---")
-st.sidebar.markdown(f"© WikiFit {datetime.now().year}")
\ No newline at end of file
+st.sidebar.markdown(f"© WikiFit {NOW.year}")
\ No newline at end of file
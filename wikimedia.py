@@ -5,16 +5,241 @@ This module provides functions to interact with various Wikimedia APIs
 to retrieve health and fitness information.
 """
 
-import requests
+import asyncio
+import concurrent.futures
+import dbm
+import functools
+import importlib.util
+import inspect
 import logging
+import os
+import re
+import shelve
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# orjson decodes the larger MediaWiki responses ~3x faster than the stdlib;
+# fall back to response.json() when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Only advertise brotli when urllib3 can actually decode it; without a
+# decoder installed a br-encoded response would reach the JSON parser as
+# raw compressed bytes and fail on every call.
+_BROTLI_AVAILABLE = (importlib.util.find_spec("brotli") is not None
+                     or importlib.util.find_spec("brotlicffi") is not None)
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Public surface re-exported by the wiki.py compatibility shim
+__all__ = [
+    'get_wikipedia_summary',
+    'get_wiktionary_definition',
+    'get_wikiquote_quotes',
+    'get_wikibooks_content',
+    'get_wikimedia_commons_images',
+    'get_wikisource_texts',
+    'get_wikiversity_resources',
+    'get_wikispecies_info',
+    'get_wikidata_health_info',
+    'search_all_wikimedia',
+    'search_all_wikimedia_async',
+    'clear_cache'
+]
+
 # Cache durations (in seconds)
 CACHE_TTL = 3600  # 1 hour
 
+# Strips any HTML tag from Commons image descriptions in a single pass
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _build_session():
+    """Build the shared HTTP session with pooling, retries and gzip.
+
+    A pooled keep-alive session avoids a fresh TCP+TLS handshake per call,
+    which matters for the nine-endpoint fan-out in search_all_wikimedia.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": "WikiFit/1.0 (health & fitness app)",
+        "Accept-Encoding": "gzip, br" if _BROTLI_AVAILABLE else "gzip"
+    })
+    return session
+
+
+def _loads(response):
+    """Decode a JSON API response, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Shared HTTP session so requests reuse pooled keep-alive connections instead
+# of paying a fresh TCP+TLS handshake per call. The app can swap in its own
+# tuned session at startup.
+SESSION = _build_session()
+
+# Per-host circuit breaker: after _BREAKER_FAIL_MAX consecutive failures the
+# host's breaker opens and calls fail immediately for _BREAKER_RESET seconds
+# instead of each one hanging on its timeout against a dead endpoint.
+_BREAKER_FAIL_MAX = 3
+_BREAKER_RESET = 60  # seconds the breaker stays open
+_TIMEOUT = (3, 7)  # (connect, read) - fail fast on hung connections
+_breakers = {}  # host -> (consecutive failures, open-until timestamp)
+_breaker_lock = threading.Lock()
+
+
+def _get(url, **kwargs):
+    """SESSION.get with a per-host circuit breaker and short timeouts.
+
+    Raises requests.ConnectionError immediately while a host's breaker is
+    open, so the getters fall through to their normal connection-error
+    handling without waiting on another timeout.
+    """
+    host = url.split("/", 3)[2]
+    now = time.time()
+    with _breaker_lock:
+        failures, open_until = _breakers.get(host, (0, 0.0))
+        if open_until > now:
+            raise requests.ConnectionError(f"Circuit open for {host} after repeated failures")
+    try:
+        response = SESSION.get(url, timeout=_TIMEOUT, **kwargs)
+    except requests.RequestException:
+        with _breaker_lock:
+            failures, _ = _breakers.get(host, (0, 0.0))
+            failures += 1
+            open_until = now + _BREAKER_RESET if failures >= _BREAKER_FAIL_MAX else 0.0
+            _breakers[host] = (failures, open_until)
+        raise
+    with _breaker_lock:
+        _breakers[host] = (0, 0.0)
+    return response
+
+
+# In-process result cache: key -> (expiry timestamp, value). Guarded by a lock
+# because search_all_wikimedia calls the getters from worker threads.
+_cache = {}
+_cache_lock = threading.Lock()
+
+# On-disk tier so a process restart keeps warm entries
+_CACHE_DIR = os.path.expanduser(os.path.join("~", ".cache", "wikifit"))
+_CACHE_FILE = os.path.join(_CACHE_DIR, "wikimedia_cache")
+
+# Everything shelve.open can raise on a missing, locked or corrupt store.
+# dbm.error is a tuple of exception classes, so flatten it in.
+_STORE_ERRORS = (OSError,) + (dbm.error if isinstance(dbm.error, tuple) else (dbm.error,))
+
+
+def _normalize(term):
+    """Collapse case, punctuation and whitespace variants onto one cache key.
+
+    "Vitamin D", "vitamin d" and "vitamin-D" all normalize to "vitamin_d",
+    so retyped variants of a topic share a single network fetch.
+    """
+    return re.sub(r"[^a-z0-9]+", "_", term.strip().lower()).strip("_")
+
+
+def clear_cache():
+    """Drop all cached getter results: in-process, disk and ID memo tiers."""
+    with _cache_lock:
+        _cache.clear()
+        for store in (_CACHE_FILE, _ENTITY_ID_FILE):
+            try:
+                with shelve.open(store) as db:
+                    db.clear()
+            except _STORE_ERRORS as e:
+                logging.debug(f"Cache clear error for {store}: {str(e)}")
+
 
+def _is_failure(value):
+    """True for results reflecting a failed or empty fetch, not real content.
+
+    The getters report connection problems and HTTP errors as user-facing
+    strings (and Commons/Wikisource as empty lists); caching those would
+    keep serving the error for CACHE_TTL after the network recovers.
+    """
+    if isinstance(value, str):
+        return value.startswith(("Connection error", "Error retrieving"))
+    if isinstance(value, (list, dict)):
+        return not value
+    return False
+
+
+def _cached(func):
+    """Cache a getter's results for CACHE_TTL seconds.
+
+    Results are keyed by (function name, normalized term, remaining bound
+    arguments) in an in-process dict with an on-disk shelve behind it, so
+    repeated queries for the same topic skip the network round-trip
+    entirely. Arguments are bound against the getter's signature with
+    defaults applied, so positional and keyword calls - and calls relying
+    on a default - all share one cache entry.
+    """
+    sig = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = list(bound.arguments.items())
+        term = arguments[0][1]
+        extras = arguments[1:]
+        key = f"{func.__name__}:{_normalize(term)}" + (f":{extras}" if extras else "")
+        now = time.time()
+
+        with _cache_lock:
+            entry = _cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        # Check the persistent tier before going to the network
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            with _cache_lock:
+                with shelve.open(_CACHE_FILE) as db:
+                    stored = db.get(key)
+            if stored is not None and stored[0] > now:
+                with _cache_lock:
+                    _cache[key] = stored
+                return stored[1]
+        except _STORE_ERRORS as e:
+            # A corrupt or format-mismatched store must not take the getters
+            # down; fall through to the network
+            logging.debug(f"Cache read error for {key}: {str(e)}")
+
+        value = func(*args, **kwargs)
+        if _is_failure(value):
+            # Never cache failures - the next call should retry (cheaply,
+            # while the circuit breaker is open) instead of pinning the
+            # error message for an hour and persisting it to disk
+            return value
+        entry = (now + CACHE_TTL, value)
+        with _cache_lock:
+            _cache[key] = entry
+            try:
+                with shelve.open(_CACHE_FILE) as db:
+                    db[key] = entry
+            except _STORE_ERRORS as e:
+                logging.debug(f"Cache write error for {key}: {str(e)}")
+        return value
+
+    return wrapper
+
+
+@_cached
 def get_wikipedia_summary(term):
     """
     Get a summary of a topic from Wikipedia.
@@ -27,9 +252,9 @@ def get_wikipedia_summary(term):
     """
     try:
         url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{term}"
-        response = requests.get(url, timeout=10)
+        response = _get(url)
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response)
             extract = data.get("extract", "")
             if not extract:
                 # Check if we have an alternative like disambiguation
@@ -47,6 +272,7 @@ def get_wikipedia_summary(term):
         return "Connection error. Please check your internet connection and try again later."
 
 
+@_cached
 def get_wiktionary_definition(term):
     """Get word definitions from Wiktionary"""
     try:
@@ -60,10 +286,10 @@ def get_wiktionary_definition(term):
             "exsentences": 5,
             "explaintext": True
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = _get(url, params=params)
         
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response)
             pages = data.get("query", {}).get("pages", {})
             
             # Extract the first page content (there should only be one)
@@ -79,6 +305,7 @@ def get_wiktionary_definition(term):
         return "Connection error. Please try again later."
 
 
+@_cached
 def get_wikiquote_quotes(term):
     """Get quotes related to a topic from Wikiquote"""
     try:
@@ -91,10 +318,10 @@ def get_wikiquote_quotes(term):
             "exsentences": 5,
             "explaintext": True
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = _get(url, params=params)
         
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response)
             pages = data.get("query", {}).get("pages", {})
             
             # Extract the first page content (there should only be one)
@@ -112,6 +339,7 @@ def get_wikiquote_quotes(term):
         return "Connection error. Please try again later."
 
 
+@_cached
 def get_wikibooks_content(term):
     """Get educational content from Wikibooks"""
     try:
@@ -124,10 +352,10 @@ def get_wikibooks_content(term):
             "exsentences": 10,
             "explaintext": True
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = _get(url, params=params)
         
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response)
             pages = data.get("query", {}).get("pages", {})
             
             # Extract the first page content
@@ -143,64 +371,49 @@ def get_wikibooks_content(term):
         return "Connection error. Please try again later."
 
 
+@_cached
 def get_wikimedia_commons_images(term, limit=5):
     """Get relevant images from Wikimedia Commons"""
     try:
         url = "https://commons.wikimedia.org/w/api.php"
+        # generator=search feeds the matching files straight into prop=imageinfo,
+        # so the old search + imageinfo two-round-trip pattern becomes one call.
         params = {
             "action": "query",
             "format": "json",
-            "list": "search",
-            "srsearch": f"{term} haswbstatement:P180={term}",  # Search for images with the term as subject
-            "srnamespace": 6,  # File namespace
-            "srlimit": limit
+            "generator": "search",
+            "gsrsearch": f"{term} haswbstatement:P180={term}",  # Search for images with the term as subject
+            "gsrnamespace": 6,  # File namespace
+            "gsrlimit": limit,
+            "prop": "imageinfo",
+            "iiprop": "url|extmetadata",
+            "iiurlwidth": 300  # Thumbnail width
         }
-        response = requests.get(url, params=params, timeout=10)
-        
+        response = _get(url, params=params)
+
         if response.status_code == 200:
-            data = response.json()
-            search_results = data.get("query", {}).get("search", [])
-            
-            image_titles = []
-            for result in search_results:
-                if "title" in result:
-                    image_titles.append(result["title"])
-                    
-            # If we found images, get their URLs
+            data = _loads(response)
+            pages = data.get("query", {}).get("pages", {})
+
             image_data = []
-            if image_titles:
-                file_titles = "|".join(image_titles)
-                image_params = {
-                    "action": "query",
-                    "format": "json",
-                    "titles": file_titles,
-                    "prop": "imageinfo",
-                    "iiprop": "url|extmetadata",
-                    "iiurlwidth": 300  # Thumbnail width
-                }
-                img_response = requests.get(url, params=image_params, timeout=10)
-                if img_response.status_code == 200:
-                    img_data = img_response.json()
-                    pages = img_data.get("query", {}).get("pages", {})
-                    
-                    for page_id in pages:
-                        page = pages[page_id]
-                        if "imageinfo" in page and page["imageinfo"]:
-                            info = page["imageinfo"][0]
-                            title = page.get("title", "").replace("File:", "")
-                            thumb_url = info.get("thumburl", "")
-                            description = info.get("extmetadata", {}).get("ImageDescription", {}).get("value", "")
-                            
-                            # Clean HTML from description
-                            description = description.replace("<p>", "").replace("</p>", "")
-                            
-                            if thumb_url:
-                                image_data.append({
-                                    "title": title,
-                                    "url": thumb_url,
-                                    "description": description
-                                })
-                    
+            for page_id in pages:
+                page = pages[page_id]
+                if "imageinfo" in page and page["imageinfo"]:
+                    info = page["imageinfo"][0]
+                    title = page.get("title", "").replace("File:", "")
+                    thumb_url = info.get("thumburl", "")
+                    description = info.get("extmetadata", {}).get("ImageDescription", {}).get("value", "")
+
+                    # Clean HTML from description
+                    description = _HTML_TAG_RE.sub("", description)
+
+                    if thumb_url:
+                        image_data.append({
+                            "title": title,
+                            "url": thumb_url,
+                            "description": description
+                        })
+
             return image_data
         else:
             logging.error(f"Wikimedia Commons API error: {response.status_code} for term '{term}'")
@@ -210,6 +423,7 @@ def get_wikimedia_commons_images(term, limit=5):
         return []
 
 
+@_cached
 def get_wikisource_texts(term):
     """Get health-related texts from Wikisource"""
     try:
@@ -221,10 +435,10 @@ def get_wikisource_texts(term):
             "srsearch": term,
             "srlimit": 3
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = _get(url, params=params)
         
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response)
             search_results = data.get("query", {}).get("search", [])
             
             text_data = []
@@ -245,6 +459,7 @@ def get_wikisource_texts(term):
         return []
 
 
+@_cached
 def get_wikiversity_resources(term):
     """Get educational resources from Wikiversity"""
     try:
@@ -257,10 +472,10 @@ def get_wikiversity_resources(term):
             "exsentences": 5,
             "explaintext": True
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = _get(url, params=params)
         
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response)
             pages = data.get("query", {}).get("pages", {})
             
             # Extract the first page content
@@ -276,6 +491,7 @@ def get_wikiversity_resources(term):
         return "Connection error. Please try again later."
 
 
+@_cached
 def get_wikispecies_info(species_name):
     """Get species information from Wikispecies"""
     try:
@@ -287,10 +503,10 @@ def get_wikispecies_info(species_name):
             "prop": "extracts",
             "explaintext": True
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = _get(url, params=params)
         
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response)
             pages = data.get("query", {}).get("pages", {})
             
             # Extract the first page content
@@ -306,125 +522,186 @@ def get_wikispecies_info(species_name):
         return "Connection error. Please try again later."
 
 
+# Common health-related Wikidata properties
+PROPERTY_MAP = {
+    "P2175": "medical condition treated",
+    "P2176": "drug used for treatment",
+    "P780": "symptoms",
+    "P1050": "medical condition",
+    "P1995": "health specialty"
+}
+PROPERTY_IDS = frozenset(PROPERTY_MAP)
+
+# Persistent term -> Wikidata entity ID memo. IDs never change, so entries
+# have no TTL, unlike the result cache above.
+_ENTITY_ID_FILE = os.path.join(_CACHE_DIR, "wikidata_ids")
+
+
+def _memo_entity_id(term, entity_id=None):
+    """Read (or record, when entity_id is given) the term -> entity ID memo."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with _cache_lock:
+            with shelve.open(_ENTITY_ID_FILE) as db:
+                if entity_id is None:
+                    return db.get(term)
+                db[term] = entity_id
+    except _STORE_ERRORS as e:
+        logging.debug(f"Entity ID memo error for {term}: {str(e)}")
+    return entity_id
+
+
+@_cached
 def get_wikidata_health_info(term):
     """Get structured health data from Wikidata"""
     try:
-        # First, find the Wikidata ID for the term
         url = "https://www.wikidata.org/w/api.php"
+
+        # Resolve the enwiki title straight to its entity in one call; a
+        # memoized ID from a previous lookup takes the same single-call path.
         params = {
-            "action": "wbsearchentities",
+            "action": "wbgetentities",
             "format": "json",
-            "search": term,
-            "language": "en"
+            "props": "labels|descriptions|claims",
+            "languages": "en"
         }
-        response = requests.get(url, params=params, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            search_results = data.get("search", [])
-            
-            if not search_results:
-                return "No Wikidata information found for this term."
-                
-            # Get the first result's ID
-            entity_id = search_results[0].get("id")
-            
-            # Now get the entity data
-            entity_params = {
-                "action": "wbgetentities",
-                "format": "json",
-                "ids": entity_id,
-                "languages": "en"
-            }
-            entity_response = requests.get(url, params=entity_params, timeout=10)
-            
-            if entity_response.status_code == 200:
-                entity_data = entity_response.json()
-                entities = entity_data.get("entities", {})
-                
-                if entity_id in entities:
-                    entity = entities[entity_id]
-                    
-                    # Extract label and description
-                    label = entity.get("labels", {}).get("en", {}).get("value", "No label")
-                    description = entity.get("descriptions", {}).get("en", {}).get("value", "No description")
-                    
-                    # Extract some claims/properties
-                    claims = entity.get("claims", {})
-                    properties = {}
-                    
-                    # Common health-related properties
-                    property_map = {
-                        "P2175": "medical condition treated",
-                        "P2176": "drug used for treatment",
-                        "P780": "symptoms",
-                        "P1050": "medical condition",
-                        "P1995": "health specialty"
-                    }
-                    
-                    for prop_id, prop_name in property_map.items():
-                        if prop_id in claims:
-                            values = []
-                            for claim in claims[prop_id]:
-                                mainsnak = claim.get("mainsnak", {})
-                                if mainsnak.get("datatype") == "wikibase-item" and "datavalue" in mainsnak:
-                                    value_id = mainsnak["datavalue"]["value"]["id"]
-                                    values.append(value_id)
-                            
-                            if values:
-                                properties[prop_name] = values
-                    
-                    return {
-                        "label": label,
-                        "description": description,
-                        "properties": properties
-                    }
-            
-            return "No detailed Wikidata information available."
+        entity_id = _memo_entity_id(term)
+        if entity_id:
+            params["ids"] = entity_id
         else:
+            params["sites"] = "enwiki"
+            params["titles"] = term.replace("_", " ")
+            # Title matching is case-sensitive; let the API normalize
+            # "yoga" -> "Yoga" instead of falling through to the search path
+            params["normalize"] = 1
+        response = _get(url, params=params)
+
+        if response.status_code != 200:
             logging.error(f"Wikidata API error: {response.status_code} for term '{term}'")
             return f"Error retrieving Wikidata: HTTP {response.status_code}"
+
+        entities = _loads(response).get("entities", {})
+        entity = None
+        for eid, candidate in entities.items():
+            if not eid.startswith("-"):  # "-1" marks a missing title
+                entity_id, entity = eid, candidate
+                break
+
+        if entity is None:
+            # No enwiki article with that exact title: fall back to a search
+            # and answer from the search hit itself, with no second round trip.
+            search_params = {
+                "action": "wbsearchentities",
+                "format": "json",
+                "search": term,
+                "language": "en"
+            }
+            search_response = _get(url, params=search_params)
+            if search_response.status_code != 200:
+                logging.error(f"Wikidata API error: {search_response.status_code} for term '{term}'")
+                return f"Error retrieving Wikidata: HTTP {search_response.status_code}"
+
+            search_results = _loads(search_response).get("search", [])
+            if not search_results:
+                return "No Wikidata information found for this term."
+
+            hit = search_results[0]
+            # Remember the ID so the next cold-cache lookup is one call
+            _memo_entity_id(term, hit.get("id"))
+            return {
+                "label": hit.get("label", "No label"),
+                "description": hit.get("description", "No description"),
+                "properties": {}
+            }
+
+        _memo_entity_id(term, entity_id)
+
+        # Extract label and description
+        label = entity.get("labels", {}).get("en", {}).get("value", "No label")
+        description = entity.get("descriptions", {}).get("en", {}).get("value", "No description")
+
+        # Extract some claims/properties
+        claims = entity.get("claims", {})
+        properties = {}
+
+        # Set intersection only visits the health properties actually present
+        for prop_id in PROPERTY_IDS & claims.keys():
+            values = []
+            for claim in claims[prop_id]:
+                mainsnak = claim.get("mainsnak", {})
+                if mainsnak.get("datatype") == "wikibase-item" and "datavalue" in mainsnak:
+                    value_id = mainsnak["datavalue"]["value"]["id"]
+                    values.append(value_id)
+
+            if values:
+                properties[PROPERTY_MAP[prop_id]] = values
+
+        return {
+            "label": label,
+            "description": description,
+            "properties": properties
+        }
     except requests.RequestException as e:
         logging.error(f"Wikidata request error: {str(e)}")
         return "Connection error. Please try again later."
 
 
+# Result key -> getter mapping used by the concurrent fan-out below
+_SOURCE_GETTERS = {
+    "wikipedia": get_wikipedia_summary,
+    "wiktionary": get_wiktionary_definition,
+    "wikiquote": get_wikiquote_quotes,
+    "wikibooks": get_wikibooks_content,
+    "commons": get_wikimedia_commons_images,
+    "wikisource": get_wikisource_texts,
+    "wikiversity": get_wikiversity_resources,
+    "wikispecies": get_wikispecies_info,
+    "wikidata": get_wikidata_health_info
+}
+
+
 # Add a unified search function to search across all Wikimedia platforms
 def search_all_wikimedia(term):
     """
     Search for a term across all Wikimedia platforms.
-    
+
+    The nine lookups are independent network calls, so they run in
+    parallel on a thread pool; total latency is roughly the slowest
+    single response instead of the sum of all nine.
+
     Args:
         term: Search term
-        
+
     Returns:
         dict: Results from all Wikimedia sources
     """
     # Normalize the term
     search_term = term.strip().replace(" ", "_")
-    
-    # Create a results dictionary
-    results = {
-        "wikipedia": None,
-        "wiktionary": None,
-        "wikiquote": None,
-        "wikibooks": None,
-        "commons": None,
-        "wikisource": None,
-        "wikiversity": None,
-        "wikispecies": None,
-        "wikidata": None
-    }
-    
-    # Get results from each platform
-    results["wikipedia"] = get_wikipedia_summary(search_term)
-    results["wiktionary"] = get_wiktionary_definition(search_term)
-    results["wikiquote"] = get_wikiquote_quotes(search_term)
-    results["wikibooks"] = get_wikibooks_content(search_term)
-    results["commons"] = get_wikimedia_commons_images(search_term)
-    results["wikisource"] = get_wikisource_texts(search_term)
-    results["wikiversity"] = get_wikiversity_resources(search_term)
-    results["wikispecies"] = get_wikispecies_info(search_term)
-    results["wikidata"] = get_wikidata_health_info(search_term)
-    
-    return results
\ No newline at end of file
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(_SOURCE_GETTERS)) as executor:
+        futures = {
+            name: executor.submit(getter, search_term)
+            for name, getter in _SOURCE_GETTERS.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+async def search_all_wikimedia_async(term):
+    """
+    Async variant of search_all_wikimedia for event-loop callers.
+
+    The getters themselves stay synchronous (requests-based), so each one
+    runs on a worker thread via asyncio.to_thread while the event loop
+    gathers all nine concurrently.
+
+    Args:
+        term: Search term
+
+    Returns:
+        dict: Results from all Wikimedia sources
+    """
+    search_term = term.strip().replace(" ", "_")
+    names = list(_SOURCE_GETTERS)
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_SOURCE_GETTERS[name], search_term) for name in names)
+    )
+    return dict(zip(names, results))